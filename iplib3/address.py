@@ -1,11 +1,17 @@
 from abc import ABCMeta, abstractmethod
-from typing import List, Tuple, Optional, Union
+from array import array
+from functools import lru_cache
+from typing import Iterable, Tuple, Optional, Union
 
 __all__ = ('IPAddress', 'IPv4', 'IPv6')
 
 # Port number constants (agnostic between IPV4 and IPV6)
 PORT_NUMBER_MIN_VALUE = 0
 PORT_NUMBER_MAX_VALUE = 65535 # 2 ** 16 - 1 == 0xFFFF
+PORT_NUMBER_MASK      = ~PORT_NUMBER_MAX_VALUE # Any set bit means the port is out of range
+
+# The mask only works for the range of an unsigned 16-bit integer
+assert PORT_NUMBER_MIN_VALUE == 0 and PORT_NUMBER_MAX_VALUE == 0xFFFF
 
 # IPv4 constants
 IPV4_SEGMENT_BIT_COUNT     = 8
@@ -32,6 +38,19 @@ IPV6_MIN_VALUE         = 0 # 0x0*0x10_000**0
 IPV6_MAX_VALUE         = 340282366920938463463374607431768211455 # 0xFFFF*0x10_000**7 + ... + 0xFFFF*0x10_000**0
                        # 0xFFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF (32)
 
+_HEX_DIGITS = b'0123456789abcdefABCDEF'
+
+# Maps ASCII codes to hexadecimal digit values, invalid characters map to 0xFF.
+# Decimal digits are exactly the values below 10, so IPv4 parsing shares it.
+_HEX = bytes(
+    int(chr(code), 16) if code in _HEX_DIGITS else 0xFF
+    for code in range(256)
+)
+
+# Maps the canonical string of each IPv4 segment value to the value.
+# Anything else, like leading zeroes or non-ASCII digits, isn't a key.
+_IPV4_SEGMENT_VALUES = {str(value): value for value in range(IPV4_MAX_SEGMENT_VALUE + 1)}
+
 
 # Note; all functions with leading underscores are considered
 # not to be part of the public interface. They may receive
@@ -60,7 +79,7 @@ def _port_validator(port_num: Optional[int]) -> bool:
         
     elif not isinstance(port_num, int):
         return False
-    elif not PORT_NUMBER_MIN_VALUE <= port_num <= PORT_NUMBER_MAX_VALUE:
+    elif port_num & PORT_NUMBER_MASK: # Negative numbers have the high bits set as well
         return False
     
     return True
@@ -138,48 +157,135 @@ def _subnet_validator(subnet: Union[str, int], protocol='ipv4') -> bool:
     raise ValueError("Invalid protocol")
 
 
-def _ipv4_validator(address: Union[str, int], strict: bool = True) -> bool:
+def _parse_ipv4_full(address: str) -> Optional[Tuple[int, Optional[int]]]:
     """
-    Validates an IPv4 address, returning a boolean.
+    Reads an already normalised IPv4 address, with an optional port,
+    returning a tuple of its integer value and its port (or None),
+    or None if it isn't one.
+
+    Segments are looked up instead of converted with int(), which
+    also rules out everything int() would accept but IPv4 doesn't.
+    Anything this doesn't return, including errors, is left to the
+    scanner in _parse_ipv4.
+    """
+
+    address, separator, port_string = address.partition(':')
+    try:
+        seg_0, seg_1, seg_2, seg_3 = map(_IPV4_SEGMENT_VALUES.__getitem__, address.split('.'))
+    except (KeyError, ValueError):
+        return None
+
+    num = seg_0 << 24 | seg_1 << 16 | seg_2 << 8 | seg_3
+    if not separator:
+        return num, None
+
+    # Non-ASCII characters become '?', so only ASCII digits pass
+    port_bytes = port_string.encode('ascii', 'replace')
+    if not port_bytes.isdigit() or len(port_bytes) > 5:
+        return None
+
+    port = int(port_bytes)
+    return (num, port) if port <= PORT_NUMBER_MAX_VALUE else None
+
+
+def _parse_ipv4(address: str, strict: bool = True, clamp_port: bool = False) -> Tuple[int, Optional[int]]:
+    """
+    Parses an IPv4 address, returning a tuple
+    of its integer value and its port (or None).
+
+    Already normalised addresses are read by _parse_ipv4_full.
+    Anything else is scanned in a single pass: segments are
+    accumulated one digit at a time and shifted into the total,
+    so no intermediate lists are made. Digits are decoded
+    through the same lookup table as in IPv6. An optional
+    port is read by the same loop after a colon.
 
     Under strict mode ensures that the numerical values
     don't exceed legal bounds, otherwise focuses on form.
+    The integer value is only meaningful in strict mode.
+
+    With clamp_port, a port above the maximum is clamped
+    to it instead of failing strict validation.
+
+    Raises ValueError on invalid IPv4 format.
     """
 
-    if isinstance(address, str):
+    parsed = _parse_ipv4_full(address)
+    if parsed is not None:
+        return parsed
+
+    try:
+        data = address.encode('ascii')
+    except UnicodeEncodeError:
+        raise ValueError("Invalid IPv4 address format; address contains invalid characters") from None
+
+    total = 0
+    segment = 0
+    digits = 0
+    dots = 0
+    in_port = False
+    limit = IPV4_MAX_SEGMENT_VALUE
+
+    for byte in data:
+        digit = _HEX[byte]
+
+        if digit < 10:
+            segment = segment * 10 + digit
+            digits += 1
+            if segment > limit:
+                if strict and not (in_port and clamp_port):
+                    # Segment or port value was too high to be strictly valid
+                    raise ValueError(f"Invalid IPv4 address format; value out of range ({segment} > {limit})")
+                segment = limit # Keeps long digit runs from growing into huge integers
+            continue
+
+        if not digits or in_port:
+            raise ValueError(f"Invalid IPv4 address format; unexpected character '{chr(byte)}'")
+
+        if byte == 46 and dots < IPV4_MAX_SEGMENT_COUNT - 1: # ord('.') == 46
+            dots += 1
+
+        elif byte == 58 and dots == IPV4_MAX_SEGMENT_COUNT - 1: # ord(':') == 58
+            # Switches over to parsing the port number
+            in_port = True
+            limit = PORT_NUMBER_MAX_VALUE
 
-        if '.' not in address:
-            return False
+        else:
+            raise ValueError(f"Invalid IPv4 address format; unexpected character '{chr(byte)}'")
 
-        address, *port = address.split(':')
-        if port: # Handles ports separately to keep the rest of the code intact
-            try:
-                port_num = int(port[0])
-            except ValueError:
-                # Port number wasn't a valid integer
-                return False
+        total = total << IPV4_SEGMENT_BIT_COUNT | segment
+        segment = 0
+        digits = 0
+
+    if not digits:
+        raise ValueError("Invalid IPv4 address format; address ended unexpectedly")
 
-            if strict:
-                if not 0 <= port_num <= PORT_NUMBER_MAX_VALUE: # 2**16
-                    # Port number was too high or too low to be strictly valid
-                    return False
+    if in_port:
+        return total, segment
+
+    if dots != IPV4_MAX_SEGMENT_COUNT - 1:
+        raise ValueError(
+            f"Invalid IPv4 address format; wrong number of segments ({dots + 1} != {IPV4_MAX_SEGMENT_COUNT})"
+        )
+
+    return total << IPV4_SEGMENT_BIT_COUNT | segment, None
+
+
+def _ipv4_validator(address: Union[str, int], strict: bool = True) -> bool:
+    """
+    Validates an IPv4 address, returning a boolean.
+
+    Under strict mode ensures that the numerical values
+    don't exceed legal bounds, otherwise focuses on form.
+    """
+
+    if isinstance(address, str):
 
         try:
-            segments = list(map(int, address.split('.')))
+            _parse_ipv4(address, strict)
         except ValueError:
-            # IPv4 address was not made of valid integers
             return False
 
-        if len(segments) != IPV4_MAX_SEGMENT_COUNT:
-            # Invalid number of segments
-            return False
-
-        if strict:
-            for seg in segments:
-                if not 0 <= seg <= IPV4_MAX_SEGMENT_VALUE:
-                    # Segment value was too high or too low to be strictly valid
-                    return False
-
         return True
 
     elif isinstance(address, int):
@@ -188,74 +294,203 @@ def _ipv4_validator(address: Union[str, int], strict: bool = True) -> bool:
     return False
 
 
-def _ipv6_validator(address: Union[str, int], strict: bool = True) -> bool:
+def _split_ipv6_port(address: str, strict: bool = True, clamp_port: bool = False) -> Tuple[str, int]:
     """
-    Validates an IPv6 address, returning a boolean.
+    Splits a bracketed IPv6 address and its port, as in
+    '[::1]:80', returning the bare address and the port.
 
-    Under strict mode ensures that the numerical values
-    don't exceed legal bounds, otherwise focuses on form.
+    Under strict mode a port above the maximum raises,
+    unless clamp_port is given, in which case it's clamped.
+
+    Raises ValueError on invalid format.
     """
 
-    if isinstance(address, str):
+    address, separator, port_string = address[1:].partition(']:')
 
-        address, *port = address.split(']:') # Try split on closing bracket and port separator
-        if port:
-            address = address[1:] # Gets rid of the opening bracket that contained the address
-            try:
-                port_num = int(port[0])
-            except ValueError:
-                # Port number wasn't a valid integer
-                return False
+    # Non-ASCII characters become '?', so only ASCII digits pass, like in _parse_ipv4
+    port_bytes = port_string.encode('ascii', 'replace')
+    if not separator or not port_bytes.isdigit():
+        raise ValueError("Invalid IPv6 address format; bracketed address must be followed by a valid port")
 
-            if strict:
-                if not 0 <= port_num <= PORT_NUMBER_MAX_VALUE: # 2**16
-                    # Port number was too high or too low to be strictly valid
-                    return False
+    # Without leading zeroes, longer digit strings are out of range anyway, no need to convert them
+    port_bytes = port_bytes.lstrip(b'0') or b'0'
+    port = int(port_bytes) if len(port_bytes) <= 5 else PORT_NUMBER_MAX_VALUE + 1
+    if port > PORT_NUMBER_MAX_VALUE:
+        if strict and not clamp_port:
+            # Port number was too high to be strictly valid
+            raise ValueError(f"Invalid IPv6 address format; port out of range (> {PORT_NUMBER_MAX_VALUE})")
+        port = PORT_NUMBER_MAX_VALUE
 
-        halves = address.split('::')
-        segments = []
+    return address, port
 
-        if len(halves) == 2:
-            # Address with zero-skip part
-            left, right = map(lambda x: x.split(':'), halves)
-            total_length = len(left) + len(right)
 
-            if halves[0]:
-                segments.extend(left)
-            else:
-                segments.append('0000')
-            
-            segments.extend(['0000' for _ in range(IPV6_MAX_SEGMENT_COUNT - total_length)])
+def _ipv6_scan_bytes(address: str) -> bytes:
+    """
+    Prepares a bare IPv6 address for the scanner in _parse_ipv6,
+    checking the colons at either end of it.
+
+    The result always ends with a colon, so that the scanner can
+    push the last segment like any other, and a leading zero-skip
+    is reduced to a single colon, which the scanner picks up as one.
+
+    Raises ValueError on invalid format.
+    """
+
+    try:
+        data = address.encode('ascii')
+    except UnicodeEncodeError:
+        raise ValueError("Invalid IPv6 address format; address contains invalid characters") from None
+
+    if not data:
+        raise ValueError("Invalid IPv6 address format; address is empty")
+
+    if data[-1:] == b':':
+        if data[-2:] != b'::':
+            raise ValueError("Invalid IPv6 address format; address cannot end with a single colon")
+    else:
+        data += b':'
+
+    if data[:1] == b':':
+        if data[:2] != b'::':
+            raise ValueError("Invalid IPv6 address format; address cannot start with a single colon")
+        data = data[1:]
+
+    return data
+
+
+def _parse_ipv6_full(address: str) -> Optional[int]:
+    """
+    Reads a full eight-segment IPv6 address, with no zero-skip,
+    returning its integer value, or None if it isn't one.
+
+    This is the most common form, and CPython's C-level split and
+    int() read it faster than the scanner in _parse_ipv6 can, so the
+    scanner is only needed for everything else, including errors.
+    """
+
+    # Non-ASCII characters become '?', so only hexadecimal digits and colons are left
+    data = address.encode('ascii', 'replace')
+    if data.translate(None, _HEX_DIGITS + b':'):
+        return None
+
+    segments = data.split(b':')
+    if len(segments) != IPV6_MAX_SEGMENT_COUNT or b'' in segments or max(map(len, segments)) > 4:
+        return None
+
+    return int(b''.join([segment.rjust(4, b'0') for segment in segments]), 16)
+
 
-            if halves[1]:
-                segments.extend(right)
+def _parse_ipv6(address: str, strict: bool = True, clamp_port: bool = False) -> Tuple[int, Optional[int]]:
+    """
+    Parses an IPv6 address, returning a tuple
+    of its integer value and its port (or None).
+
+    Full eight-segment addresses without a port are read by
+    _parse_ipv6_full. Anything else is scanned in a single pass:
+    hexadecimal digits are decoded through a lookup table and
+    shifted into the current segment. Each colon ends a segment;
+    those before the zero-skip (::) go to the head, the rest to
+    the tail, and the two are only combined once the end is reached.
+
+    Under strict mode ensures that the numerical values
+    don't exceed legal bounds, otherwise focuses on form.
+    The integer value is only meaningful in strict mode.
+
+    With clamp_port, a port above the maximum is clamped
+    to it instead of failing strict validation.
+
+    Raises ValueError on invalid IPv6 format.
+    """
+
+    port = None
+    if address[:1] == '[':
+        address, port = _split_ipv6_port(address, strict, clamp_port)
+
+    elif '::' not in address:
+        num = _parse_ipv6_full(address)
+        if num is not None:
+            return num, None
+
+    data = _ipv6_scan_bytes(address)
+
+    head = 0
+    tail = 0
+    head_segs = 0
+    tail_segs = 0
+    saw_dcolon = False
+    segment = 0
+    digits = 0
+
+    for byte in data:
+        nibble = _HEX[byte]
+
+        if nibble != 0xFF:
+            segment = segment << 4 | nibble
+            digits += 1
+            if segment & ~IPV6_MAX_SEGMENT_VALUE:
+                if strict:
+                    # Segment value was too high to be strictly valid
+                    raise ValueError(
+                        f"Invalid IPv6 address format; segment max value passed ({segment} > {IPV6_MAX_SEGMENT_VALUE})"
+                    )
+                segment &= IPV6_MAX_SEGMENT_VALUE # Keeps long digit runs from growing into huge integers
+            continue
+
+        if byte != 58: # ord(':') == 58
+            raise ValueError("Invalid IPv6 address format; address contains invalid characters")
+
+        if digits:
+            if saw_dcolon:
+                tail = tail << IPV6_SEGMENT_BIT_COUNT | segment
+                tail_segs += 1
             else:
-                segments.append('0000')
+                head = head << IPV6_SEGMENT_BIT_COUNT | segment
+                head_segs += 1
 
-        elif len(halves) == 1:
-            # Full address
-            segments.extend(halves[0].split(':'))
+            segment = 0
+            digits = 0
+
+        elif saw_dcolon:
+            # A colon right after another one, for the second time
+            raise ValueError("Invalid IPv6 address format; only one zero-skip allowed")
 
         else:
-            # More than one zero-skip
-            return False
+            saw_dcolon = True
+
+    segment_count = head_segs + tail_segs
+
+    if saw_dcolon:
+        if segment_count >= IPV6_MAX_SEGMENT_COUNT:
+            # The zero-skip has to stand for at least one segment
+            raise ValueError(
+                f"Invalid IPv6 address format; too many segments ({segment_count} >= {IPV6_MAX_SEGMENT_COUNT})"
+            )
+
+        return head << IPV6_SEGMENT_BIT_COUNT * (IPV6_MAX_SEGMENT_COUNT - head_segs) | tail, port
+
+    if segment_count != IPV6_MAX_SEGMENT_COUNT:
+        raise ValueError(
+            f"Invalid IPv6 address format; wrong number of segments ({segment_count} != {IPV6_MAX_SEGMENT_COUNT})"
+        )
+
+    return head, port
+
+
+def _ipv6_validator(address: Union[str, int], strict: bool = True) -> bool:
+    """
+    Validates an IPv6 address, returning a boolean.
+
+    Under strict mode ensures that the numerical values
+    don't exceed legal bounds, otherwise focuses on form.
+    """
+
+    if isinstance(address, str):
 
         try:
-            processed_segments: List[int] = list(map(lambda x: int(x, 16) if x else 0, segments))
+            _parse_ipv6(address, strict)
         except ValueError:
-            # IPv6 address was not made of valid hexadecimal numbers
             return False
 
-        if len(processed_segments) != IPV6_MAX_SEGMENT_COUNT:
-            # Invalid number of segments
-            return False
-
-        if strict:
-            for seg in processed_segments:
-                if not 0 <= seg <= IPV6_MAX_SEGMENT_VALUE:
-                    # Segment value was too high or too low to be strictly valid
-                    return False
-
         return True
 
     elif isinstance(address, int):
@@ -264,6 +499,32 @@ def _ipv6_validator(address: Union[str, int], strict: bool = True) -> bool:
     return False
 
 
+@lru_cache(maxsize=1024)
+def _parse_ipv4_cached(address: str) -> Tuple[int, Optional[int]]:
+    """
+    Memoized strict _parse_ipv4, used when constructing IPv4 objects.
+    Out-of-range ports in the string are clamped, not rejected.
+
+    Only the parsed integer and port are cached, because the
+    address objects themselves are mutable via the port setter.
+    """
+
+    return _parse_ipv4(address, clamp_port=True)
+
+
+@lru_cache(maxsize=1024)
+def _parse_ipv6_cached(address: str) -> Tuple[int, Optional[int]]:
+    """
+    Memoized strict _parse_ipv6, used when constructing IPv6 objects.
+    Out-of-range ports in the string are clamped, not rejected.
+
+    Only the parsed integer and port are cached, because the
+    address objects themselves are mutable via the port setter.
+    """
+
+    return _parse_ipv6(address, clamp_port=True)
+
+
 def _ip_validator(address: Union[str, int], strict: bool = True):
     if _ipv4_validator(address, strict):
         return True
@@ -274,25 +535,28 @@ class PureAddress(metaclass=ABCMeta):
     """
     Abstract base class for IP addresses
     """
-    __slots__ = ('_num', '_port')
+    __slots__ = ('_num', '_port', '_hash', '_str_cache')
 
 
     @abstractmethod
     def __init__(self):
         self._num: int = 0
         self._port: Optional[int] = None
+        self._hash: Optional[int] = None
+        self._str_cache: Optional[str] = None
 
 
     @property
     def num(self) -> int:
         """
         Negative numbers aren't valid,
-        they are treated as zero.
+        they are treated as zero when
+        the address is created.
 
         TODO: Consider whether negative numbers should raise an exception
         """
 
-        return max(0, self._num)
+        return self._num
 
 
     @property
@@ -300,13 +564,13 @@ class PureAddress(metaclass=ABCMeta):
         """
         Returns the port in the address, or None if no port is specified
 
+        Out-of-range ports are clamped when the address is created,
+        and the setter rejects them, so no checks are needed here.
+
         TODO: Consider whether invalid numbers should raise an exception
         """
-        
-        if self._port is None:
-            return None
-        
-        return min(max(PORT_NUMBER_MIN_VALUE, self._port), PORT_NUMBER_MAX_VALUE)
+
+        return self._port
 
 
     @port.setter
@@ -326,6 +590,8 @@ class PureAddress(metaclass=ABCMeta):
             raise ValueError(f"Port number '{value}' not in valid range ({PORT_NUMBER_MIN_VALUE}-{PORT_NUMBER_MAX_VALUE})")
         
         self._port = value
+        self._hash = None # Cached values depend on the port
+        self._str_cache = None
 
 
     @property
@@ -355,11 +621,7 @@ class PureAddress(metaclass=ABCMeta):
         Generates an IPv4 string from an integer
         """
 
-        segments = []
-        for _ in range(IPV4_MAX_SEGMENT_COUNT):
-            num, segment = divmod(num, IPV4_MAX_SEGMENT_VALUE+1)
-            segments.append(segment)
-        return '.'.join(map(str, segments[::-1]))
+        return f"{num >> 24 & 0xFF}.{num >> 16 & 0xFF}.{num >> 8 & 0xFF}.{num & 0xFF}"
 
 
     @staticmethod
@@ -369,10 +631,9 @@ class PureAddress(metaclass=ABCMeta):
         with optional zero removal and shortening.
         """
 
-        segments = []
-        for _ in range(IPV6_MAX_SEGMENT_COUNT):
-            num, segment = divmod(num, IPV6_MAX_SEGMENT_VALUE+1)
-            segments.append(hex(segment).split('x')[1].upper())
+        # Segments are listed in network order, most significant first
+        data = (num & IPV6_MAX_VALUE).to_bytes(16, 'big')
+        segments = [f"{data[idx] << 8 | data[idx+1]:X}" for idx in range(0, 16, 2)]
 
         if remove_zeroes and '0' in segments:
 
@@ -380,31 +641,39 @@ class PureAddress(metaclass=ABCMeta):
             # longest strip with nothing but zeroes
             # and replaces it with an empty string.
             # The final str.join will turn to '::'.
+            # Ties go to the leftmost strip.
+
+            # The scan starts from the first zero and stops as soon as
+            # the segments left can't hold a longer strip.
 
             longest = 0
             longest_idx = 0
             current = 0
             current_idx = 0
             
-            for idx, seg in enumerate(segments):
+            for idx in range(segments.index('0'), IPV6_MAX_SEGMENT_COUNT):
 
-                if seg == '0':
+                if segments[idx] != '0':
 
-                    if not current:
-                        current_idx = idx
-                    current += 1
-
-                else:
+                    if IPV6_MAX_SEGMENT_COUNT - idx - 1 <= longest:
+                        break
                     current = 0
+                    continue
+
+                if not current:
+                    current_idx = idx
+                current += 1
 
                 if current > longest:
                     longest = current
                     longest_idx = current_idx
 
+            # A strip at either end needs an extra empty string
+            # on that side for the join to produce the '::'.
             segments = (
-                (segments[:longest_idx] if 0 < longest_idx < IPV6_MAX_SEGMENT_COUNT-1 else [''])
+                (segments[:longest_idx] or [''])
                 + ['']
-                + (segments[longest_idx+longest:] if 0 < longest_idx+longest < IPV6_MAX_SEGMENT_COUNT else [''])
+                + (segments[longest_idx+longest:] or [''])
             )
 
         if not shorten:
@@ -414,26 +683,48 @@ class PureAddress(metaclass=ABCMeta):
 
             segments = [seg.zfill(4) if seg else '' for seg in segments]
 
-        return ':'.join(segments[::-1])
+        return ':'.join(segments)
 
 
     def __eq__(self, other) -> bool:
+        """
+        Addresses are equal when their numbers and ports are.
+        They also equal their own string form, so that
+        IPv4('1.1.1.1') == '1.1.1.1', but note that the
+        two don't hash alike; see __hash__.
+        """
 
-        # To accommodate strings
-        if str(self) == str(other):
+        if other is self:
             return True
-        
-        if not isinstance(other, PureAddress):
-            return False
-        
-        if not self.num == other.num and self.port == other.port:
-            return False
 
-        return True
+        if isinstance(other, PureAddress):
+            return self._num == other._num and self._port == other._port
+
+        # To accommodate strings
+        if isinstance(other, str):
+            return str(self) == other
+
+        return False
+
+
+    def __hash__(self) -> int:
+        """
+        Hashes the address number and port, caching the result
+        until the port is changed.
+
+        This is consistent with equality between addresses only.
+        An address compares equal to its string form but doesn't
+        share its hash, so sets and dicts of addresses can't be
+        searched with strings; convert them with IPAddress first.
+        """
+
+        if self._hash is None:
+            self._hash = hash((self._num, self._port))
+        return self._hash
 
 
 class IPAddress(PureAddress):
-    __slots__ = ('_num', '_port', '_ipv4', '_ipv6', '_submask')
+    __slots__ = ('_num', '_port', '_submask')
 
     def __new__(cls, address: Union[int, str, None] = None, *args, **kwargs):
 
@@ -448,11 +739,11 @@ class IPAddress(PureAddress):
 
 
     def __init__(self, address_num=0, port_num=None):
-        self._num = address_num if address_num is not None else 0
+        self._num = max(0, address_num) if address_num is not None else 0
         self._port = port_num if _port_validator(port_num) else None
-        self._ipv4 = None
-        self._ipv6 = None
         self._submask = None
+        self._hash = None
+        self._str_cache = None
 
 
     def __repr__(self) -> str:
@@ -460,19 +751,30 @@ class IPAddress(PureAddress):
 
 
     def __str__(self) -> str:
-        
-        if IPV4_MIN_VALUE <= self.num <= IPV4_MAX_VALUE:
-            if self._ipv4 is None:
-                self._ipv4 = self.as_ipv4
-            return str(self._ipv4)
-
-        elif IPV4_MAX_VALUE < self.num <= IPV6_MAX_VALUE:
-            if self._ipv6 is None:
-                self._ipv6 = self.as_ipv6
-            return str(self._ipv6)
+        """
+        Formats the address directly from its number, matching
+        str(self.as_ipv4) or str(self.as_ipv6) without creating
+        either object. The result is cached until the port changes.
+        """
+
+        if self._str_cache is not None:
+            return self._str_cache
+
+        num = self.num
+        port = self.port
+
+        if IPV4_MIN_VALUE <= num <= IPV4_MAX_VALUE:
+            address = self._num_to_ipv4(num)
+            self._str_cache = address if port is None else f"{address}:{port}"
+
+        elif IPV4_MAX_VALUE < num <= IPV6_MAX_VALUE:
+            address = self._num_to_ipv6(num, shorten=True, remove_zeroes=False)
+            self._str_cache = address if port is None else f"[{address}]:{port}"
         
         else:
-            raise ValueError(f"No valid address representation exists for {self.num}")
+            raise ValueError(f"No valid address representation exists for {num}")
+
+        return self._str_cache
 
 
     @property
@@ -489,25 +791,28 @@ class IPv4(IPAddress):
     __slots__ = ('_num', '_address', '_port')
 
     def __init__(self, address: str, port_num: Optional[int] = None):
-        
-        self._port = port_num
 
-        _address, *_port = address.split(':')
-        if _port:
-            address = _address
+        self._num, _port = _parse_ipv4_cached(address)
+        if port_num is not None:
+            port_num = min(max(PORT_NUMBER_MIN_VALUE, port_num), PORT_NUMBER_MAX_VALUE)
 
-            if port_num is None:
-                self._port = int(_port[0])
+        self._port = _port if port_num is None else port_num
+
+        if _port is not None:
+            address = address.partition(':')[0] # Removes the port
 
         self._address = address
-        self._num = self._ipv4_to_num()
+        self._hash = None
+        self._str_cache = None
 
 
     def __str__(self) -> str:
-        if self._port is not None:
-            return f"{self._address}:{self._port}"
-        else:
-            return self._address
+        if self._str_cache is None:
+            if self._port is not None:
+                self._str_cache = f"{self._address}:{self._port}"
+            else:
+                self._str_cache = self._address
+        return self._str_cache
 
 
     def _ipv4_to_num(self) -> int:
@@ -518,13 +823,32 @@ class IPv4(IPAddress):
         Raises ValueError on invalid IPv4 format.
         """
 
-        segments = list(map(int, self._address.split('.')))[::-1]
-        total = 0
+        return _parse_ipv4_cached(self._address)[0]
 
-        for idx, num in enumerate(segments):
-            total += num * 2**(idx * 8)
-    
-        return total
+
+    @staticmethod
+    def parse_many(addresses: Iterable[str]) -> Tuple[array, array]:
+        """
+        Parses many IPv4 addresses at once without creating IPv4 objects.
+
+        Returns two parallel arrays, one of address numbers ('L')
+        and one of ports ('l'), where -1 means no port was given.
+
+        The parse cache is bypassed, since batches are mostly unique
+        addresses that would only evict the ones in regular use.
+
+        Raises ValueError on the first invalid IPv4 address.
+        """
+
+        nums = array('L')
+        ports = array('l')
+
+        for address in addresses:
+            num, port = _parse_ipv4(address, clamp_port=True)
+            nums.append(num)
+            ports.append(-1 if port is None else port)
+
+        return nums, ports
 
 
 class IPv6(IPAddress):
@@ -532,24 +856,27 @@ class IPv6(IPAddress):
 
     def __init__(self, address: str, port_num: Optional[int] = None):
 
-        self._port = port_num
+        self._num, _port = _parse_ipv6_cached(address)
+        if port_num is not None:
+            port_num = min(max(PORT_NUMBER_MIN_VALUE, port_num), PORT_NUMBER_MAX_VALUE)
 
-        _address, *_port = address.split(']:')
-        if _port:
-            address = _address[1:] # Removes the opening square bracket
+        self._port = _port if port_num is None else port_num
 
-            if port_num is None:
-                self._port = int(_port[0])
+        if _port is not None:
+            address = address[1:].partition(']:')[0] # Removes the square brackets and the port
 
         self._address = address
-        self._num = self._ipv6_to_num()
+        self._hash = None
+        self._str_cache = None
 
 
     def __str__(self) -> str:
-        if self._port is not None:
-            return f"[{self._address}]:{self._port}"
-        else:
-            return self._address
+        if self._str_cache is None:
+            if self._port is not None:
+                self._str_cache = f"[{self._address}]:{self._port}"
+            else:
+                self._str_cache = self._address
+        return self._str_cache
 
 
     def _ipv6_to_num(self) -> int:
@@ -560,52 +887,32 @@ class IPv6(IPAddress):
         Raises ValueError on invalid IPv6 format.
         """
 
-        halves = self._address.split('::')
-        segments = []
-
-        if len(halves) == 2:
-        # Address with zero-skip part
-            left, right = map(lambda x: x.split(':'), halves)
-            total_length = len(left) + len(right)
+        return _parse_ipv6_cached(self._address)[0]
 
-            if halves[0]:
-                segments.extend(left)
-            else:
-                segments.append('0000')
-            
-            segments.extend(['0000' for _ in range(IPV6_MAX_SEGMENT_COUNT - total_length)])
 
-            if halves[1]:
-                segments.extend(right)
-            else:
-                segments.append('0000')
+    @staticmethod
+    def parse_many(addresses: Iterable[str]) -> Tuple[array, array, array]:
+        """
+        Parses many IPv6 addresses at once without creating IPv6 objects.
 
-        elif len(halves) == 1:
-            # Full address
-            segments.extend(halves[0].split(':'))
+        Returns three parallel arrays, the high and low 64-bit halves
+        of the address numbers ('Q') and the ports ('l'), where -1
+        means no port was given.
 
-        else:
-            raise ValueError("Invalid IPv6 address format; only one zero-skip allowed")
-        
-        try:
-            processed_segments: List[int] = list(map(lambda num: int(num, 16) if num != '' else 0, segments[::-1]))
-        except ValueError:
-            raise ValueError(f"Invalid IPv6 address format; address contains invalid characters")
+        The parse cache is bypassed, since batches are mostly unique
+        addresses that would only evict the ones in regular use.
 
-        segment_count = len(processed_segments)
-        if segment_count > IPV6_MAX_SEGMENT_COUNT:
-            raise ValueError(f"Invalid IPv6 address format; too many segments ({segment_count} > {IPV6_MAX_SEGMENT_COUNT})")
+        Raises ValueError on the first invalid IPv6 address.
+        """
 
-        highest = max(processed_segments)
-        if highest > IPV6_MAX_SEGMENT_VALUE:
-            raise ValueError(f"Invalid IPv6 address format; segment max value passed ({highest} > {IPV6_MAX_SEGMENT_VALUE})")
+        highs = array('Q')
+        lows = array('Q')
+        ports = array('l')
 
-        lowest = min(processed_segments)
-        if 0 > lowest:
-            raise ValueError(f"Invalid IPv6 address format; segment min value passed ({lowest} < 0)")
-        
-        total = 0
-        for idx, num in enumerate(processed_segments):
-            total += num * 2**(idx * 16)
+        for address in addresses:
+            num, port = _parse_ipv6(address, clamp_port=True)
+            highs.append(num >> 64)
+            lows.append(num & 0xFFFF_FFFF_FFFF_FFFF)
+            ports.append(-1 if port is None else port)
 
-        return total
+        return highs, lows, ports
@@ -5,6 +5,9 @@ from iplib3 import ( # pylint: disable=import-error,no-name-in-module
 )
 from iplib3.address import ( # pylint: disable=import-error,no-name-in-module
     _ipv4_validator, _ipv6_validator,
+    _parse_ipv4, _parse_ipv6,
+    _parse_ipv4_full, _parse_ipv6_full,
+    _parse_ipv4_cached, _parse_ipv6_cached,
     _port_validator, _subnet_validator,
     _ipv4_subnet_validator, _ipv6_subnet_validator,
 
@@ -31,6 +34,20 @@ def test_ipv4():
     assert str(IPAddress(0xDEADBEEF, port_num=80).as_ipv4) == '222.173.190.239:80'
 
 
+def test_address_dispatch():
+    assert isinstance(IPAddress('0.0.0.0'), IPv4)
+    assert isinstance(IPAddress('255.255.255.255:65535'), IPv4)
+    assert isinstance(IPAddress('010.010.010.010:000080'), IPv4)
+    assert IPAddress('010.010.010.010:000080') == IPv4('10.10.10.10:80')
+    assert isinstance(IPAddress('::1'), IPv6)
+    assert isinstance(IPAddress('[::1]:80'), IPv6)
+    assert isinstance(IPAddress('2606:4700:4700:1111:2606:4700:4700:1111'), IPv6)
+
+    # Short dotted strings are still malformed IPv4, not IPv6
+    with pytest.raises(ValueError, match='IPv4') as e_info: # pylint: disable=unused-variable
+        IPAddress('1.1.1')
+
+
 def test_ipv4_port_initialisation():
 
     foo = IPv4('222.173.190.239:80')
@@ -42,6 +59,21 @@ def test_ipv4_port_initialisation():
     assert str(baz) == '222.173.190.239:80'
 
 
+def test_ipv4_out_of_range():
+
+    # Ports in the string are clamped, like explicitly given ones
+    assert IPv4('1.1.1.1:70000').port == PORT_NUMBER_MAX_VALUE
+    assert str(IPv4('1.1.1.1:70000')) == f"1.1.1.1:{PORT_NUMBER_MAX_VALUE}"
+    assert IPv4('1.1.1.1:70000', port_num=80).port == 80
+
+    # Segments are not, there is no sensible value to clamp them to
+    with pytest.raises(ValueError) as e_info: # pylint: disable=unused-variable
+        IPAddress('256.1.1.1')
+
+    with pytest.raises(ValueError) as e_info: # pylint: disable=unused-variable
+        IPv4('1.1.1.1:abc', port_num=80)
+
+
 def test_ipv6():
     assert str(IPAddress(25601440).as_ipv6) == '0:0:0:0:0:0:186:A5A0'
     assert str(IPAddress('2606:4700:4700::1111')) == '2606:4700:4700::1111'
@@ -51,6 +83,21 @@ def test_ipv6():
     assert str(IPAddress(0xDEADBEEF).as_ipv6) == '0:0:0:0:0:0:DEAD:BEEF'
 
 
+def test_ipv6_out_of_range():
+
+    assert IPv6('[::1]:70000').port == PORT_NUMBER_MAX_VALUE
+    assert str(IPv6('[::1]:70000')) == f"[::1]:{PORT_NUMBER_MAX_VALUE}"
+    assert IPv6('[::1]:70000', port_num=80).port == 80
+    assert IPv6('[::1]:' + '7' * 100_000).port == PORT_NUMBER_MAX_VALUE
+
+    # Leading zeroes don't make a port out of range, same as in IPv4
+    assert IPv6('[::1]:000080').port == IPv4('1.1.1.1:000080').port == 80
+    assert IPv6('[::1]:' + '0' * 100_000).port == 0
+
+    with pytest.raises(ValueError) as e_info: # pylint: disable=unused-variable
+        IPAddress('10000::')
+
+
 def test_ipv6_full():
     assert IPAddress(25601440).num_to_ipv6(shorten=False) == '0000:0000:0000:0000:0000:0000:0186:A5A0'
 
@@ -58,6 +105,10 @@ def test_ipv6_full():
 def test_ipv6_remove_zeroes():
     assert IPAddress(25601440).num_to_ipv6(remove_zeroes=True) == '::186:A5A0'
     assert IPAddress(0xDEADBEEF).num_to_ipv6(remove_zeroes=True) == '::DEAD:BEEF'
+    assert IPAddress(0xDEADBEEF << 96).num_to_ipv6(remove_zeroes=True) == 'DEAD:BEEF::'
+    assert IPAddress(0xFFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF).num_to_ipv6(remove_zeroes=True) == '::FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF'
+    assert IPAddress(0x0001_0000_0000_0001_0000_0000_0001_0001).num_to_ipv6(remove_zeroes=True) == '1::1:0:0:1:1'
+    assert IPAddress(0).num_to_ipv6(remove_zeroes=True) == '::'
 
 
 def test_ipv6_port_initialisation():
@@ -71,6 +122,100 @@ def test_ipv6_port_initialisation():
     assert str(baz) == '[::1337:1337:1337:1337]:25565'
 
 
+def test_parse_cache():
+
+    hits = _parse_ipv4_cached.cache_info().hits
+    foo = IPv4('10.0.0.1:8080')
+    bar = IPv4('10.0.0.1:8080')
+    bar.port = 80 # Caching must not share state between instances
+
+    assert _parse_ipv4_cached.cache_info().hits > hits
+    assert str(foo) == '10.0.0.1:8080'
+    assert str(bar) == '10.0.0.1:80'
+
+    hits = _parse_ipv6_cached.cache_info().hits
+    foo = IPv6('[::10:0:0:1]:8080')
+    bar = IPv6('[::10:0:0:1]:8080')
+    bar.port = 80
+
+    assert _parse_ipv6_cached.cache_info().hits > hits
+    assert str(foo) == '[::10:0:0:1]:8080'
+    assert str(bar) == '[::10:0:0:1]:80'
+
+
+def test_equality():
+    assert IPv4('1.1.1.1') == '1.1.1.1'
+    assert IPv6('[::1]:80') == '[::1]:80'
+    assert IPAddress(0xDEADBEEF) == IPv6('::DEAD:BEEF')
+    assert IPv6('::1') == IPv6('0:0:0:0:0:0:0:1')
+
+    assert IPv4('1.1.1.1:80') != IPv4('1.1.1.2:8080')
+    assert IPv4('1.1.1.1:80') != IPv4('1.1.1.1')
+    assert IPv4('1.1.1.1') != 16843009
+
+
+def test_hashing():
+
+    foo = IPv4('222.173.190.239:80')
+    bar = IPv4('222.173.190.239', port_num=80)
+    baz = IPv6('[::1337:1337:1337:1337]:25565')
+
+    assert hash(foo) == hash(bar)
+    assert len({foo, bar, baz}) == 2
+    assert foo in {bar: None}
+
+    bar.port = 8080
+    assert hash(foo) != hash(bar)
+    assert str(bar) == '222.173.190.239:8080'
+
+    # Equal to its string form, but hashed differently; strings
+    # have to be turned into addresses for container lookups
+    assert foo == '222.173.190.239:80'
+    assert '222.173.190.239:80' not in {foo}
+    assert IPAddress('222.173.190.239:80') in {foo}
+
+
+def test_parse_many():
+
+    nums, ports = IPv4.parse_many(['1.134.165.160', '222.173.190.239:80'])
+    assert list(nums) == [25601440, 0xDEADBEEF]
+    assert list(ports) == [-1, 80]
+
+    highs, lows, ports = IPv6.parse_many(['::186:A5A0', '[FFFF::DEAD:BEEF]:80'])
+    assert list(highs) == [0, 0xFFFF << 48]
+    assert list(lows) == [25601440, 0xDEADBEEF]
+    assert list(ports) == [-1, 80]
+
+    # Batches don't go through the parse cache used by construction
+    misses = _parse_ipv4_cached.cache_info().misses
+    IPv4.parse_many(['10.1.0.1', '10.1.0.2'])
+    assert _parse_ipv4_cached.cache_info().misses == misses
+
+    with pytest.raises(ValueError) as e_info: # pylint: disable=unused-variable
+        IPv4.parse_many(['1.1.1.1', '1.1.1'])
+
+
+def test_address_str():
+
+    foo = IPAddress(0xDEADBEEF)
+    bar = IPAddress(0xDEADBEEF << 64)
+
+    assert str(foo) == str(foo.as_ipv4) == '222.173.190.239'
+    assert str(bar) == str(bar.as_ipv6) == '0:0:DEAD:BEEF:0:0:0:0'
+
+    foo.port = 80
+    bar.port = 80
+
+    assert str(foo) == str(foo.as_ipv4) == '222.173.190.239:80'
+    assert str(bar) == str(bar.as_ipv6) == '[0:0:DEAD:BEEF:0:0:0:0]:80'
+
+
+def test_write_time_clamping():
+    assert IPAddress(-1).num == 0
+    assert IPv4('1.1.1.1', port_num=PORT_NUMBER_MAX_VALUE+1).port == PORT_NUMBER_MAX_VALUE
+    assert str(IPv6('::1', port_num=PORT_NUMBER_MIN_VALUE-1)) == f"[::1]:{PORT_NUMBER_MIN_VALUE}"
+
+
 def test_chaining():
     assert str(IPAddress(25601440).as_ipv6.as_ipv4) == '1.134.165.160'
 
@@ -103,12 +248,66 @@ def test_ipv4_validator():
     assert _ipv4_validator('1337.1337.1337.1337', strict=False) is True
     assert _ipv4_validator('1337.1337.1337.1337:314159', strict=False) is True
 
+    assert _ipv4_validator('1.1.1.') is False
+    assert _ipv4_validator('.1.1.1') is False
+    assert _ipv4_validator('1..1.1') is False
+    assert _ipv4_validator('1.1.1.1:') is False
+    assert _ipv4_validator('1.1.1:80') is False
+    assert _ipv4_validator('1.1.1.1:80:80') is False
+    assert _ipv4_validator('1.1.1.-1') is False
+    assert _ipv4_validator('1.1.1.a') is False
+    assert _ipv4_validator('1.1.1.\u0661') is False
+
+    # int() accepts these, but they aren't IPv4 addresses in either mode
+    for address in (' 1.1.1.1', '1.1.1.1\n', '1.1.1.1: 80', '+1.1.1.1', '1.1.1.1:+80', '-0.1.1.1', '-1.1.1.1',
+                    '1.1.1.1:-1', '1_0.1.1.1', '1.1.1.1:8_0', '\u0661.1.1.1', '1.1.1.1:\u0668\u0660'):
+        assert _ipv4_validator(address) is False
+        assert _ipv4_validator(address, strict=False) is False
+
+    assert _ipv4_validator('1' * 100_000 + '.1.1.1') is False
+    assert _ipv4_validator('1' * 100_000 + '.1.1.1', strict=False) is True
+    assert _ipv4_validator('1.1.1.1:' + '1' * 100_000, strict=False) is True
+
     assert _ipv4_validator(25601440) is True
     assert _ipv4_validator(0xDEADBEEF) is True
     assert _ipv4_validator(25601440, strict=False) is True
     assert _ipv4_validator(0xDEADBEEF, strict=False) is True
 
 
+def test_ipv4_parser():
+    assert _parse_ipv4('0.0.0.0') == (IPV4_MIN_VALUE, None)
+    assert _parse_ipv4('255.255.255.255') == (IPV4_MAX_VALUE, None)
+    assert _parse_ipv4('1.134.165.160') == (25601440, None)
+    assert _parse_ipv4('222.173.190.239:80') == (0xDEADBEEF, 80)
+
+    with pytest.raises(ValueError) as e_info: # pylint: disable=unused-variable
+        _parse_ipv4('256.0.0.0')
+
+    with pytest.raises(ValueError) as e_info: # pylint: disable=unused-variable
+        _parse_ipv4('1.1.1.1:65536')
+
+
+def test_ipv4_full_parser():
+    assert _parse_ipv4_full('0.0.0.0') == (IPV4_MIN_VALUE, None)
+    assert _parse_ipv4_full('255.255.255.255:65535') == (IPV4_MAX_VALUE, PORT_NUMBER_MAX_VALUE)
+    assert _parse_ipv4_full('222.173.190.239:80') == (0xDEADBEEF, 80)
+
+    # Left to the scanner, which still accepts the valid ones
+    for address in ('01.1.1.1', '1.1.1.1:000080', '256.1.1.1', '1.1.1.1:65536', '1.1.1', '1.1.1.1:',
+                    ' 1.1.1.1', '+1.1.1.1', '1.1.1.1:+80', '1.1.1.1:\u0668\u0660', '1.1.1.\u0661'):
+        assert _parse_ipv4_full(address) is None
+
+    assert _parse_ipv4('01.1.1.1') == (0x01010101, None)
+    assert _parse_ipv4('1.1.1.1:000080') == (0x01010101, 80)
+
+
+def test_ipv4_to_num():
+    for segments in ((0, 0, 0, 0), (1, 134, 165, 160), (127, 0, 0, 1), (222, 173, 190, 239), (255, 255, 255, 255)):
+        address = '.'.join(map(str, segments))
+        assert IPv4(address).num == int.from_bytes(bytes(segments), 'big')
+        assert IPv4(f"{address}:8080").num == int.from_bytes(bytes(segments), 'big')
+
+
 def test_ipv6_validator():
     assert _ipv6_validator('0:0:0:0:0:0:0:0') is True
     assert _ipv6_validator('FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF') is True
@@ -117,6 +316,73 @@ def test_ipv6_validator():
     assert _ipv6_validator('::12') is True
     assert _ipv6_validator('314::') is True
     assert _ipv6_validator('2606:4700:4700::1111') is True
+    assert _ipv6_validator('::') is True
+
+    assert _ipv6_validator('') is False
+    assert _ipv6_validator(':') is False
+    assert _ipv6_validator(':::') is False
+    assert _ipv6_validator(':1:2:3:4:5:6:7') is False
+    assert _ipv6_validator('1:2:3:4:5:6:7:') is False
+    assert _ipv6_validator('1::2::3') is False
+    assert _ipv6_validator('1:2:3:4:5:6:7') is False
+    assert _ipv6_validator('1:2:3:4:5:6:7:8:9') is False
+    assert _ipv6_validator('1::2:3:4:5:6:7:8') is False
+    assert _ipv6_validator('G::') is False
+    assert _ipv6_validator('\u0661::') is False
+    assert _ipv6_validator('[::1]') is False
+    assert _ipv6_validator('[::1]:65536') is False
+    assert _ipv6_validator('[::1]:000080') is True
+    assert _ipv6_validator('[::1]:0000065536') is False
+    assert _ipv6_validator('[::1]:\u0668\u0660') is False
+    assert _ipv6_validator('[::1]:+80') is False
+    assert _ipv6_validator('12345::') is False
+    assert _ipv6_validator('12345::', strict=False) is True
+    assert _ipv6_validator('::12345') is False
+    assert _ipv6_validator('1:2:3:10000:5:6:7:8') is False
+    assert _ipv6_validator('1:2:3:4:5:6:7:10000') is False
+    assert _ipv6_validator('1:2:3:4:5:6:7:00001') is True
+    assert _ipv6_validator('1:2:3:4:5:6:7:0x1') is False
+    assert _ipv6_validator('1:2:3:4:5:6:7:+1') is False
+    assert _ipv6_validator('1:2:3:4:5:6:7: 1') is False
+    assert _ipv6_validator('1:2:3:4:5:6:7:1_0') is False
+    assert _ipv6_validator('1:2:3:4:5:6:7:\u0661') is False
+    assert _ipv6_validator('f' * 100_000 + '::') is False
+    assert _ipv6_validator('f' * 100_000 + '::', strict=False) is True
+
+
+def test_ipv6_full_parser():
+    assert _parse_ipv6_full('0:0:0:0:0:0:0:0') == IPV6_MIN_VALUE
+    assert _parse_ipv6_full('FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:ffff') == IPV6_MAX_VALUE
+
+    # Left to the scanner, which still accepts the valid ones
+    for address in ('::1', '1:2:3:4:5:6:7:00008', '1:2:3:4:5:6:7', '1:2:3:4:5:6:7:', '1:2:3:4:5:6:7:0x8',
+                    '1:2:3:4:5:6:7: 8', '1:2:3:4:5:6:7:\u0668'):
+        assert _parse_ipv6_full(address) is None
+
+
+def test_ipv6_to_num():
+    for segments in ((0,) * 8, (0, 0, 0, 0, 0, 0, 0x186, 0xA5A0), (0x2606, 0x4700, 0x4700, 0, 0, 0, 0, 0x1111), (0xFFFF,) * 8):
+        address = ':'.join(f"{seg:x}" for seg in segments)
+        expected = int.from_bytes(b''.join(seg.to_bytes(2, 'big') for seg in segments), 'big')
+        assert IPv6(address).num == expected
+        assert IPv6(f"[{address}]:8080").num == expected
+
+
+def test_ipv6_parser():
+    assert _parse_ipv6('::') == (IPV6_MIN_VALUE, None)
+    assert _parse_ipv6('FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF:FFFF') == (IPV6_MAX_VALUE, None)
+    assert _parse_ipv6('::186:a5a0') == (25601440, None)
+    assert _parse_ipv6('[::DEAD:BEEF]:80') == (0xDEADBEEF, 80)
+    assert _parse_ipv6('2606:4700:4700::1111') == (0x2606_4700_4700_0000_0000_0000_0000_1111, None)
+    assert _parse_ipv6('1::') == (1 << 112, None)
+    assert _parse_ipv6('fe80:0:0:0:202:b3ff:fe1e:8329') == (0xfe80_0000_0000_0000_0202_b3ff_fe1e_8329, None)
+    assert _parse_ipv6('1:2:3:4:5:6:7:00008') == (0x0001_0002_0003_0004_0005_0006_0007_0008, None)
+
+    with pytest.raises(ValueError) as e_info: # pylint: disable=unused-variable
+        _parse_ipv6('1:2:3:4:5:6:7')
+
+    with pytest.raises(ValueError) as e_info: # pylint: disable=unused-variable
+        _parse_ipv6('10000::')
 
 
 def test_port_validator():